@@ -2,9 +2,6 @@
 CLI Entry Point for API Toolkit
 """
 import click
-from rich.console import Console
-
-console = Console()
 
 
 @click.group()
@@ -22,6 +19,8 @@ def cli() -> None:
 @cli.command()
 def hello() -> None:
     """Comando de prueba para verificar instalación"""
+    from api_toolkit.display.console import console
+    
     console.print("[bold green]✓[/bold green] API Toolkit está funcionando!")
     console.print("Usa [cyan]api-toolkit --help[/cyan] para ver todos los comandos")
 
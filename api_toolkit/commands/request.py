@@ -1,20 +1,25 @@
 """
 Comandos para hacer requests HTTP
 """
-from typing import Optional
+import asyncio
+from typing import Optional, TextIO, Union
 
 import click
-import httpx
-from rich.console import Console
 
-from api_toolkit.core.http_client import HttpClient
+from api_toolkit.display.console import console
 from api_toolkit.display.formatters import (
     ResponseFormatter,
     print_error,
     print_info,
 )
+from api_toolkit.models.request_models import (
+    _VALID_METHODS,
+    DEFAULT_MAX_BODY,
+    HttpResponse,
+)
 
-console = Console()
+# httpx, HttpClient y la caché se importan dentro de cada comando para no
+# pagar su costo de import en `--help` o en otros comandos
 
 
 @click.group(name="request")
@@ -41,11 +46,37 @@ def request_group() -> None:
     is_flag=True,
     help="No mostrar headers de respuesta"
 )
+@click.option(
+    "--max-body",
+    default=DEFAULT_MAX_BODY,
+    type=click.IntRange(min=0),
+    help="Máximo de bytes del body a leer (default: 1 MiB)"
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help="Usar la caché en disco de responses (default: desactivada)"
+)
+@click.option(
+    "--cache-ttl",
+    default=300,
+    type=int,
+    help="Segundos de validez de las entradas en caché (default: 300)"
+)
+@click.option(
+    "--http1",
+    is_flag=True,
+    help="Usar HTTP/1.1 en lugar de HTTP/2"
+)
 def get_command(
     url: str,
     header: tuple[str, ...],
     timeout: int,
     no_headers: bool,
+    max_body: int,
+    cache: bool,
+    cache_ttl: int,
+    http1: bool,
 ) -> None:
     """
     Hacer GET request a una URL
@@ -57,15 +88,29 @@ def get_command(
             -H "Authorization: Bearer token123" \\
             -H "Accept: application/json"
     """
+    import httpx
+    
+    from api_toolkit.core.cache import ResponseCache
+    from api_toolkit.core.http_client import HttpClient
+    
     headers = _parse_headers(header)
     
     with console.status("[bold green]Making request..."):
         try:
-            client = HttpClient(timeout=timeout)
-            response = client.get(url, headers=headers)
+            response_cache = ResponseCache(ttl=cache_ttl) if cache else None
+            with HttpClient(
+                timeout=timeout,
+                cache=response_cache,
+                max_body=max_body,
+                http2=not http1,
+            ) as client:
+                response = client.get(url, headers=headers)
             
             console.clear_live()
-            print_info(f"Request completed in {response.elapsed_time * 1000:.0f}ms")
+            if response.from_cache:
+                print_info(f"Response served from cache in {response.elapsed_time * 1000:.0f}ms")
+            else:
+                print_info(f"Request completed in {response.elapsed_time * 1000:.0f}ms")
             ResponseFormatter.format_response(response, show_headers=not no_headers)
             
         except httpx.HTTPError as e:
@@ -96,12 +141,25 @@ def get_command(
     is_flag=True,
     help="No mostrar headers de respuesta"
 )
+@click.option(
+    "--max-body",
+    default=DEFAULT_MAX_BODY,
+    type=click.IntRange(min=0),
+    help="Máximo de bytes del body a leer (default: 1 MiB)"
+)
+@click.option(
+    "--http1",
+    is_flag=True,
+    help="Usar HTTP/1.1 en lugar de HTTP/2"
+)
 def post_command(
     url: str,
     header: tuple[str, ...],
     data: Optional[str],
     timeout: int,
     no_headers: bool,
+    max_body: int,
+    http1: bool,
 ) -> None:
     """
     Hacer POST request a una URL
@@ -111,12 +169,16 @@ def post_command(
             -H "Content-Type: application/json" \\
             -d '{"name": "John Doe", "email": "john@example.com"}'
     """
+    import httpx
+    
+    from api_toolkit.core.http_client import HttpClient
+    
     headers = _parse_headers(header)
     
     with console.status("[bold green]Making request..."):
         try:
-            client = HttpClient(timeout=timeout)
-            response = client.post(url, headers=headers, body=data)
+            with HttpClient(timeout=timeout, max_body=max_body, http2=not http1) as client:
+                response = client.post(url, headers=headers, body=data)
             
             console.clear_live()
             print_info(f"Request completed in {response.elapsed_time * 1000:.0f}ms")
@@ -134,20 +196,28 @@ def post_command(
 @click.option("--data", "-d", help="Body del request")
 @click.option("--timeout", "-t", default=30, type=int)
 @click.option("--no-headers", is_flag=True)
+@click.option("--max-body", default=DEFAULT_MAX_BODY, type=click.IntRange(min=0))
+@click.option("--http1", is_flag=True, help="Usar HTTP/1.1 en lugar de HTTP/2")
 def put_command(
     url: str,
     header: tuple[str, ...],
     data: Optional[str],
     timeout: int,
     no_headers: bool,
+    max_body: int,
+    http1: bool,
 ) -> None:
     """Hacer PUT request a una URL"""
+    import httpx
+    
+    from api_toolkit.core.http_client import HttpClient
+    
     headers = _parse_headers(header)
     
     with console.status("[bold green]Making request..."):
         try:
-            client = HttpClient(timeout=timeout)
-            response = client.put(url, headers=headers, body=data)
+            with HttpClient(timeout=timeout, max_body=max_body, http2=not http1) as client:
+                response = client.put(url, headers=headers, body=data)
             
             console.clear_live()
             print_info(f"Request completed in {response.elapsed_time * 1000:.0f}ms")
@@ -164,19 +234,27 @@ def put_command(
 @click.option("--header", "-H", multiple=True, help="Header HTTP")
 @click.option("--timeout", "-t", default=30, type=int)
 @click.option("--no-headers", is_flag=True)
+@click.option("--max-body", default=DEFAULT_MAX_BODY, type=click.IntRange(min=0))
+@click.option("--http1", is_flag=True, help="Usar HTTP/1.1 en lugar de HTTP/2")
 def delete_command(
     url: str,
     header: tuple[str, ...],
     timeout: int,
     no_headers: bool,
+    max_body: int,
+    http1: bool,
 ) -> None:
     """Hacer DELETE request a una URL"""
+    import httpx
+    
+    from api_toolkit.core.http_client import HttpClient
+    
     headers = _parse_headers(header)
     
     with console.status("[bold green]Making request..."):
         try:
-            client = HttpClient(timeout=timeout)
-            response = client.delete(url, headers=headers)
+            with HttpClient(timeout=timeout, max_body=max_body, http2=not http1) as client:
+                response = client.delete(url, headers=headers)
             
             console.clear_live()
             print_info(f"Request completed in {response.elapsed_time * 1000:.0f}ms")
@@ -188,6 +266,81 @@ def delete_command(
             raise click.Abort()
 
 
+@request_group.command(name="batch")
+@click.argument("urls", nargs=-1)
+@click.option(
+    "--file", "-f", "url_file",
+    type=click.File("r"),
+    help="Archivo con una URL por línea (líneas vacías y '#' se ignoran)"
+)
+@click.option(
+    "--method", "-X",
+    default="GET",
+    type=click.Choice(sorted(_VALID_METHODS), case_sensitive=False),
+    help="Método HTTP para todos los requests (default: GET)"
+)
+@click.option("--header", "-H", multiple=True, help="Header HTTP (común a todos)")
+@click.option("--data", "-d", help="Body del request (común a todos)")
+@click.option(
+    "--concurrency", "-c",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Máximo de requests simultáneos (default: 20)"
+)
+@click.option("--timeout", "-t", default=30, type=int)
+@click.option("--max-body", default=DEFAULT_MAX_BODY, type=click.IntRange(min=0))
+@click.option("--http1", is_flag=True, help="Usar HTTP/1.1 en lugar de HTTP/2")
+def batch_command(
+    urls: tuple[str, ...],
+    url_file: Optional[TextIO],
+    method: str,
+    header: tuple[str, ...],
+    data: Optional[str],
+    concurrency: int,
+    timeout: int,
+    max_body: int,
+    http1: bool,
+) -> None:
+    """
+    Hacer múltiples requests en paralelo
+    
+    Ejemplo:
+        api-toolkit request batch https://api.example.com/a https://api.example.com/b
+        
+        api-toolkit request batch -f urls.txt -c 50
+    """
+    from api_toolkit.core.http_client import HttpClient
+    
+    headers = _parse_headers(header)
+    
+    targets = list(urls)
+    if url_file is not None:
+        for line in url_file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                targets.append(line)
+    
+    if not targets:
+        print_error("No se especificaron URLs")
+        raise click.Abort()
+    
+    async def run() -> list[Union[HttpResponse, BaseException]]:
+        async with HttpClient(timeout=timeout, max_body=max_body, http2=not http1) as client:
+            return await client.gather(
+                targets,
+                method=method,
+                headers=headers,
+                body=data,
+                concurrency=concurrency,
+            )
+    
+    with console.status(f"[bold green]Making {len(targets)} requests..."):
+        results = asyncio.run(run())
+    
+    print_info(f"{len(targets)} requests completados")
+    ResponseFormatter.format_batch(targets, results)
+
+
 def _parse_headers(headers: tuple[str, ...]) -> dict[str, str]:
     """
     Parse headers desde formato CLI a dict
@@ -200,11 +353,11 @@ def _parse_headers(headers: tuple[str, ...]) -> dict[str, str]:
     """
     parsed = {}
     for header in headers:
-        if ":" not in header:
+        key, sep, value = header.partition(":")
+        if not sep:
             print_error(f"Header inválido: '{header}'. Formato esperado: 'Key: Value'")
             raise click.Abort()
         
-        key, value = header.split(":", 1)
         parsed[key.strip()] = value.strip()
     
     return parsed
\ No newline at end of file
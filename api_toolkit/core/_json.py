@@ -0,0 +1,42 @@
+"""
+Helpers JSON: usa orjson si está instalado, si no la librería estándar
+"""
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional (extra "fast")
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError es subclase de json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+# orjson convierte a float los enteros fuera de [i64 mín, u64 máx], perdiendo
+# precisión. Con 19 dígitos o más puede pasar (p. ej. -9999999999999999999):
+# en ese caso se usa la librería estándar
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def loads(data: str) -> Any:
+    """Parsea un documento JSON"""
+    if orjson is not None and not _LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rechaza NaN/Infinity, que la librería estándar acepta
+            pass
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serializa a JSON indentado con 2 espacios, sin escapar caracteres no ASCII"""
+    if orjson is not None:
+        try:
+            dumped: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+            return dumped.decode()
+        except orjson.JSONEncodeError:
+            # orjson tiene un límite de anidamiento menor que el de loads
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -0,0 +1,98 @@
+"""
+Caché persistente en disco para responses HTTP
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from api_toolkit.core import _json
+
+
+def default_cache_path() -> Path:
+    """Retorna la ruta por defecto de la base de datos de caché"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "api-toolkit" / "responses.db"
+
+
+class ResponseCache:
+    """Caché clave-valor con expiración sobre SQLite"""
+    
+    def __init__(self, path: Optional[Path] = None, ttl: int = 300) -> None:
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+    
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: Optional[str] = None,
+    ) -> str:
+        """Genera la clave de caché a partir del request"""
+        raw = method + url + json.dumps(headers, sort_keys=True) + (body or "")
+        return hashlib.blake2b(raw.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Busca una entrada vigente en la caché
+        
+        Args:
+            key: Clave generada con make_key()
+            
+        Returns:
+            La entrada guardada, o None si no existe o expiró
+        """
+        found = self.lookup(key)
+        if found is None or not found[1]:
+            return None
+        return found[0]
+    
+    def lookup(self, key: str) -> Optional[tuple[dict[str, Any], bool]]:
+        """
+        Busca una entrada en la caché, aunque haya expirado
+        
+        Útil para revalidar con el servidor (ETag / Last-Modified) una
+        entrada vencida en lugar de descargarla de nuevo.
+        
+        Args:
+            key: Clave generada con make_key()
+            
+        Returns:
+            Tupla (entrada, vigente), o None si no existe
+        """
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return _json.loads(row[0]), row[1] >= time.time()
+    
+    def set(self, key: str, value: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Guarda una entrada en la caché
+        
+        Args:
+            key: Clave generada con make_key()
+            value: Datos serializables a JSON
+            ttl: Segundos de validez (default: el ttl de la caché)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+    
+    def close(self) -> None:
+        """Cierra la conexión a la base de datos"""
+        self._conn.close()
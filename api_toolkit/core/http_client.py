@@ -1,18 +1,149 @@
 """
 Cliente HTTP usando httpx
 """
+import asyncio
 import time
-from typing import Optional
+from typing import Any, Optional, Union
 
 import httpx
-from api_toolkit.models.request_model import HttpRequest, HttpResponse
+
+from api_toolkit.core.cache import ResponseCache
+from api_toolkit.models.request_models import DEFAULT_MAX_BODY, HttpRequest, HttpResponse
+
+# Métodos idempotentes cuyas respuestas se pueden cachear
+_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Límites del pool de conexiones, compartidos por el cliente sync y el async
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30,
+)
+
+# Tamaño de los chunks al leer el body en streaming
+_CHUNK_SIZE = 65536
+
+
+def _cache_ttl(cache_control: str) -> Optional[int]:
+    """
+    TTL con el que guardar una entrada en la caché
+    
+    Con Cache-Control: no-cache la entrada se guarda ya vencida, para que se
+    revalide con el servidor antes de cada uso (sin validadores, una entrada
+    vencida cuenta como miss). None usa el TTL de la caché.
+    """
+    if "no-cache" in cache_control:
+        return 0
+    return None
+
+
+def _body_encoding(response: httpx.Response) -> str:
+    """Encoding con el que se decodifica el body de la respuesta"""
+    return response.charset_encoding or "utf-8"
+
+
+class _BodyReader:
+    """Acumula el body hasta max_body bytes, contando el tamaño total"""
+    
+    def __init__(self, max_body: int) -> None:
+        self.max_body = max_body
+        self.total_size = 0
+        self._chunks: list[bytes] = []
+    
+    def feed(self, chunk: bytes) -> None:
+        """Agrega un chunk, descartando lo que exceda max_body"""
+        remaining = self.max_body - self.total_size
+        if remaining > 0:
+            self._chunks.append(chunk[:remaining])
+        self.total_size += len(chunk)
+    
+    @property
+    def truncated(self) -> bool:
+        """Indica si se descartó parte del body"""
+        return self.total_size > self.max_body
+    
+    def text(self, response: httpx.Response) -> str:
+        """Decodifica los bytes acumulados según el charset de la respuesta"""
+        return b"".join(self._chunks).decode(_body_encoding(response), errors="replace")
 
 
 class HttpClient:
     """Cliente HTTP wrapper sobre httpx"""
     
-    def __init__(self, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        timeout: int = 30,
+        cache: Optional[ResponseCache] = None,
+        max_body: int = DEFAULT_MAX_BODY,
+        http2: bool = True,
+    ) -> None:
         self.timeout = timeout
+        self.cache = cache
+        self.max_body = max_body
+        self.http2 = http2
+        # Cliente persistente: reutiliza conexiones (keep-alive) entre requests
+        # y, con HTTP/2, multiplexa los requests a un mismo host. Se crea bajo
+        # demanda: el modo batch solo usa el cliente async
+        self._client: Optional[httpx.Client] = None
+        # Cliente async, se crea bajo demanda dentro del event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+    
+    def close(self) -> None:
+        """Cierra el cliente y libera las conexiones abiertas"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self.cache is not None:
+            self.cache.close()
+    
+    async def aclose(self) -> None:
+        """Cierra el cliente async si fue creado"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def __enter__(self) -> "HttpClient":
+        """Permite usar el cliente como context manager"""
+        return self
+    
+    def __exit__(self, *args: object) -> None:
+        """Cierra el cliente al salir del bloque with"""
+        self.close()
+    
+    def __del__(self) -> None:
+        """Cierra el cliente si no se cerró explícitamente"""
+        client = getattr(self, "_client", None)
+        if client is not None and not client.is_closed:
+            client.close()
+    
+    async def __aenter__(self) -> "HttpClient":
+        """Permite usar el cliente como async context manager"""
+        return self
+    
+    async def __aexit__(self, *args: object) -> None:
+        """Cierra ambos clientes al salir del bloque async with"""
+        await self.aclose()
+        self.close()
+    
+    def _get_client(self) -> httpx.Client:
+        """Retorna el cliente sync compartido, creándolo si no existe"""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=_LIMITS,
+            )
+        return self._client
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Retorna el cliente async compartido, creándolo si no existe"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=_LIMITS,
+            )
+        return self._async_client
     
     def request(
         self,
@@ -48,48 +179,238 @@ class HttpClient:
         )
         
         # Medir tiempo de respuesta
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        cache = self.cache if request.method in _CACHEABLE_METHODS else None
+        cache_key = ""
+        cached = None
+        request_headers = request.headers
+        if cache is not None:
+            cache_key = ResponseCache.make_key(
+                request.method, request.url, request.headers, request.body
+            )
+            found = cache.lookup(cache_key)
+            if found is not None:
+                cached, fresh = found
+                if fresh:
+                    return self._cached_response(
+                        cached, request, time.perf_counter() - start_time
+                    )
+                # Entrada vencida: revalidar con el servidor si hay validadores
+                if cached.get("etag") or cached.get("last_modified"):
+                    request_headers = dict(request.headers)
+                    if cached.get("etag"):
+                        request_headers["If-None-Match"] = cached["etag"]
+                    if cached.get("last_modified"):
+                        request_headers["If-Modified-Since"] = cached["last_modified"]
+                else:
+                    cached = None
         
         try:
-            with httpx.Client(timeout=request.timeout) as client:
-                response = client.request(
-                    method=request.method,
-                    url=request.url,
-                    headers=request.headers,
-                    content=request.body.encode() if request.body else None,
+            # Leer el body en streaming, guardando como máximo max_body bytes
+            reader = _BodyReader(self.max_body)
+            with self._get_client().stream(
+                method=request.method,
+                url=request.url,
+                headers=request_headers,
+                content=request.body.encode() if request.body else None,
+                timeout=request.timeout,
+            ) as response:
+                for chunk in response.iter_bytes(_CHUNK_SIZE):
+                    reader.feed(chunk)
+            
+            elapsed_time = time.perf_counter() - start_time
+            
+            # 304: la entrada en caché sigue siendo válida
+            if cache is not None and cached is not None and response.status_code == 304:
+                # Los headers del 304 actualizan los guardados (RFC 9111 §4.3.4)
+                cached["headers"].update(
+                    (key, value) for key, value in response.headers.items()
+                    if key != "content-length"
                 )
-                
-                elapsed_time = time.time() - start_time
-                
-                # Crear modelo de respuesta
-                http_response = HttpResponse(
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    body=response.text,
-                    elapsed_time=elapsed_time,
-                    request=request,
+                cached["etag"] = response.headers.get("etag", cached.get("etag"))
+                cached["last_modified"] = response.headers.get(
+                    "last-modified", cached.get("last_modified")
                 )
-                
-                return http_response
-                
+                ttl = _cache_ttl(cached["headers"].get("cache-control", ""))
+                cache.set(cache_key, cached, ttl=ttl)
+                return self._cached_response(cached, request, elapsed_time)
+            
+            # Crear modelo de respuesta
+            http_response = HttpResponse(
+                status_code=response.status_code,
+                headers=response.headers,
+                body=reader.text(response),
+                elapsed_time=elapsed_time,
+                request=request,
+                truncated=reader.truncated,
+                total_size=reader.total_size,
+            )
+            
+            cache_control = response.headers.get("cache-control", "")
+            if (
+                cache is not None
+                and response.status_code == 200
+                and not http_response.truncated
+                and "no-store" not in cache_control
+            ):
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                cache.set(cache_key, {
+                    "status_code": http_response.status_code,
+                    "headers": dict(http_response.headers),
+                    "body": http_response.body,
+                    "total_size": http_response.total_size,
+                    "encoding": _body_encoding(response),
+                    "etag": etag,
+                    "last_modified": last_modified,
+                }, ttl=_cache_ttl(cache_control))
+            
+            return http_response
+            
         except httpx.TimeoutException as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             raise httpx.HTTPError(f"Request timeout después de {elapsed_time:.2f}s") from e
         except httpx.ConnectError as e:
             raise httpx.HTTPError(f"No se pudo conectar a {url}") from e
     
-    def get(self, url: str, **kwargs: dict) -> HttpResponse:
+    def _cached_response(
+        self,
+        cached: dict[str, Any],
+        request: HttpRequest,
+        elapsed_time: float,
+    ) -> HttpResponse:
+        """
+        Reconstruye una HttpResponse a partir de una entrada de la caché
+        
+        La entrada puede venir de una ejecución con otro max_body, así que
+        el body se vuelve a cortar según el max_body de este cliente.
+        """
+        body = cached["body"]
+        truncated = cached["total_size"] > self.max_body
+        if truncated:
+            encoding = cached.get("encoding", "utf-8")
+            encoded = body.encode(encoding, errors="replace")
+            body = encoded[:self.max_body].decode(encoding, errors="replace")
+        
+        return HttpResponse(
+            status_code=cached["status_code"],
+            headers=httpx.Headers(cached["headers"]),
+            body=body,
+            elapsed_time=elapsed_time,
+            request=request,
+            from_cache=True,
+            truncated=truncated,
+            total_size=cached["total_size"],
+        )
+    
+    def get(self, url: str, **kwargs: Any) -> HttpResponse:
         """Convenience method para GET"""
         return self.request("GET", url, **kwargs)
     
-    def post(self, url: str, **kwargs: dict) -> HttpResponse:
+    def post(self, url: str, **kwargs: Any) -> HttpResponse:
         """Convenience method para POST"""
         return self.request("POST", url, **kwargs)
     
-    def put(self, url: str, **kwargs: dict) -> HttpResponse:
+    def put(self, url: str, **kwargs: Any) -> HttpResponse:
         """Convenience method para PUT"""
         return self.request("PUT", url, **kwargs)
     
-    def delete(self, url: str, **kwargs: dict) -> HttpResponse:
+    def delete(self, url: str, **kwargs: Any) -> HttpResponse:
         """Convenience method para DELETE"""
-        return self.request("DELETE", url, **kwargs)
\ No newline at end of file
+        return self.request("DELETE", url, **kwargs)
+    
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> HttpResponse:
+        """
+        Versión async de request(), usando el cliente async compartido
+        
+        Args:
+            method: Método HTTP (GET, POST, etc.)
+            url: URL destino
+            headers: Headers opcionales
+            body: Body del request (para POST/PUT)
+            timeout: Timeout en segundos
+            
+        Returns:
+            HttpResponse con la respuesta
+            
+        Raises:
+            httpx.HTTPError: Si hay error en el request
+        """
+        request = HttpRequest(
+            method=method,
+            url=url,
+            headers=headers or {},
+            body=body,
+            timeout=timeout or self.timeout
+        )
+        
+        client = self._get_async_client()
+        start_time = time.perf_counter()
+        
+        try:
+            reader = _BodyReader(self.max_body)
+            async with client.stream(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                content=request.body.encode() if request.body else None,
+                timeout=request.timeout,
+            ) as response:
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    reader.feed(chunk)
+            
+            elapsed_time = time.perf_counter() - start_time
+            
+            return HttpResponse(
+                status_code=response.status_code,
+                headers=response.headers,
+                body=reader.text(response),
+                elapsed_time=elapsed_time,
+                request=request,
+                truncated=reader.truncated,
+                total_size=reader.total_size,
+            )
+            
+        except httpx.TimeoutException as e:
+            elapsed_time = time.perf_counter() - start_time
+            raise httpx.HTTPError(f"Request timeout después de {elapsed_time:.2f}s") from e
+        except httpx.ConnectError as e:
+            raise httpx.HTTPError(f"No se pudo conectar a {url}") from e
+    
+    async def gather(
+        self,
+        urls: list[str],
+        method: str = "GET",
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[str] = None,
+        concurrency: int = 20,
+    ) -> list[Union[HttpResponse, BaseException]]:
+        """
+        Realiza varios requests en paralelo
+        
+        Args:
+            urls: URLs destino
+            method: Método HTTP para todos los requests
+            headers: Headers opcionales (comunes a todos)
+            body: Body opcional (común a todos)
+            concurrency: Máximo de requests simultáneos
+            
+        Returns:
+            Lista en el mismo orden que urls, con la HttpResponse o la
+            excepción que produjo cada request
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def one(url: str) -> HttpResponse:
+            async with sem:
+                return await self.request_async(method, url, headers=headers, body=body)
+        
+        return await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
@@ -0,0 +1,6 @@
+"""
+Console de Rich compartida por toda la aplicación
+"""
+from rich.console import Console
+
+console = Console()
@@ -1,17 +1,115 @@
 """
 Formatters para mostrar información en terminal con Rich
 """
-import json
-from typing import Optional
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Union
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
+from rich.text import Text
 
-from api_toolkit.models.request_model import HttpResponse
+# Panel, Table, Syntax y Pygments se importan al usarse: este módulo se
+# carga con cada comando (print_error, print_info) y no todos los necesitan
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
 
-console = Console()
+from api_toolkit.core import _json
+from api_toolkit.display.console import console
+from api_toolkit.models.request_models import HttpResponse
+
+# Color por familia de status code (índice: status_code // 100)
+_STATUS_COLORS = ("white", "white", "green", "yellow", "orange1", "red")
+
+# (color, texto) de los status codes más comunes
+_STATUS_INFO = {
+    200: ("green", "OK"),
+    201: ("green", "Created"),
+    204: ("green", "No Content"),
+    301: ("yellow", "Moved Permanently"),
+    302: ("yellow", "Found"),
+    400: ("orange1", "Bad Request"),
+    401: ("orange1", "Unauthorized"),
+    403: ("orange1", "Forbidden"),
+    404: ("orange1", "Not Found"),
+    405: ("orange1", "Method Not Allowed"),
+    500: ("red", "Internal Server Error"),
+    502: ("red", "Bad Gateway"),
+    503: ("red", "Service Unavailable"),
+}
+
+# Bodies más grandes que esto (en caracteres) se muestran truncados y sin
+# syntax highlighting
+_HIGHLIGHT_LIMIT = 16_384
+
+# Líneas que se muestran del preview de un body grande
+_PREVIEW_LINES = 40
+
+# Headers de respuesta que se muestran (en minúsculas)
+_ALLOWED_HEADERS = frozenset({
+    "content-type", "content-length", "server",
+    "date", "cache-control", "x-ratelimit-remaining",
+})
+
+
+@lru_cache(maxsize=None)
+def _get_lexer(name: str) -> "Lexer":
+    """Retorna un lexer de Pygments reutilizable para el lenguaje dado"""
+    from pygments.lexers import get_lexer_by_name
+    
+    return get_lexer_by_name(name)
+
+
+def _get_status_info(status_code: int) -> tuple[str, str]:
+    """Retorna (color, texto descriptivo) según status code"""
+    info = _STATUS_INFO.get(status_code)
+    if info is not None:
+        return info
+    family = status_code // 100
+    if 0 <= family < len(_STATUS_COLORS):
+        return _STATUS_COLORS[family], ""
+    return "white", ""
+
+
+class _StreamedText:
+    """
+    Preview de un body grande que se imprime línea por línea
+    
+    Así Rich no tiene que medir y cortar todo el texto antes de escribir
+    el primer byte, y el output empieza a verse enseguida. Se muestran como
+    máximo _PREVIEW_LINES líneas.
+    """
+    
+    def __init__(self, text: str) -> None:
+        self.text = text
+    
+    def _lines(self) -> Iterator[str]:
+        """Primeras _PREVIEW_LINES líneas del texto, con su salto de línea"""
+        return islice(self.text.splitlines(keepends=True), _PREVIEW_LINES)
+    
+    def print_lines(self) -> None:
+        """Imprime el preview línea por línea, sin word wrapping de Rich"""
+        line = "\n"
+        for line in self._lines():
+            console.print(line, end="", markup=False, highlight=False, soft_wrap=True)
+        if not line.endswith("\n"):
+            console.print()
+    
+    def __rich_console__(
+        self, render_console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Permite usarlo como renderable normal (por ejemplo dentro de un Group)"""
+        yield Text("".join(self._lines()).rstrip("\n"))
+
+
+def _plain_body(text: str, total_size: int) -> list[RenderableType]:
+    """Retorna el body como texto plano, truncado a _HIGHLIGHT_LIMIT si es grande"""
+    if len(text) <= _HIGHLIGHT_LIMIT:
+        return [Text(text)]
+    return [
+        _StreamedText(text[:_HIGHLIGHT_LIMIT]),
+        Text(f"... ({total_size} bytes total)", style="dim"),
+    ]
 
 
 class ResponseFormatter:
@@ -26,116 +124,144 @@ class ResponseFormatter:
             response: HttpResponse a mostrar
             show_headers: Si mostrar los headers de la respuesta
         """
+        from rich.panel import Panel
+        from rich.table import Table
+        
         # Status y métricas
-        status_color = ResponseFormatter._get_status_color(response.status_code)
+        status_color, status_text = _get_status_info(response.status_code)
         
-        console.print()
-        console.print(Panel(
+        # Se arma todo el output y se imprime con un único console.print
+        # (salvo los bodies grandes, que se imprimen en streaming)
+        parts: list[RenderableType] = [Text()]
+        parts.append(Panel(
             f"[{status_color}]Status:[/{status_color}] {response.status_code} "
-            f"{ResponseFormatter._get_status_text(response.status_code)}\n"
+            f"{status_text}\n"
             f"[cyan]Time:[/cyan] {response.elapsed_time * 1000:.0f}ms\n"
-            f"[cyan]Size:[/cyan] {len(response.body)} bytes",
+            f"[cyan]Size:[/cyan] {response.total_size} bytes"
+            f"{' [dim](truncated)[/dim]' if response.truncated else ''}",
             title=f"[bold]Response - {response.request.method} {response.request.url}[/bold]",
             border_style=status_color,
         ))
         
         # Headers
         if show_headers and response.headers:
-            console.print("\n[bold]Headers:[/bold]")
-            headers_table = Table(show_header=False, box=None, padding=(0, 2))
-            headers_table.add_column(style="cyan")
-            headers_table.add_column()
+            # Mostrar solo algunos headers importantes
+            shown = [
+                (key, value) for key, value in response.headers.items()
+                if key.lower() in _ALLOWED_HEADERS
+            ]
             
-            for key, value in response.headers.items():
-                # Mostrar solo algunos headers importantes
-                if key.lower() in [
-                    "content-type", "content-length", "server",
-                    "date", "cache-control", "x-ratelimit-remaining"
-                ]:
+            if shown:
+                headers_table = Table(show_header=False, box=None, padding=(0, 2))
+                headers_table.add_column(style="cyan")
+                headers_table.add_column()
+                
+                for key, value in shown:
                     headers_table.add_row(key, value)
-            
-            console.print(headers_table)
+                
+                parts.append(Text.from_markup("\n[bold]Headers:[/bold]"))
+                parts.append(headers_table)
         
         # Body
-        console.print("\n[bold]Body:[/bold]")
-        ResponseFormatter._format_body(response)
-        console.print()
+        parts.append(Text.from_markup("\n[bold]Body:[/bold]"))
+        parts.extend(ResponseFormatter._format_body(response))
+        parts.append(Text())
+        
+        pending: list[RenderableType] = []
+        for part in parts:
+            if isinstance(part, _StreamedText):
+                console.print(Group(*pending))
+                part.print_lines()
+                pending = []
+            else:
+                pending.append(part)
+        console.print(Group(*pending))
+    
+    @staticmethod
+    def format_batch(
+        urls: list[str],
+        results: list[Union[HttpResponse, BaseException]],
+    ) -> None:
+        """
+        Muestra un resumen en tabla de un batch de requests
+        
+        Args:
+            urls: URLs solicitadas, en el mismo orden que results
+            results: HttpResponse o excepción de cada request
+        """
+        from rich.table import Table
+        
+        table = Table(title="[bold]Batch results[/bold]")
+        table.add_column("URL", style="cyan", overflow="fold")
+        table.add_column("Status", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Size", justify="right")
+        
+        for url, result in zip(urls, results):
+            if isinstance(result, HttpResponse):
+                color, _ = _get_status_info(result.status_code)
+                table.add_row(
+                    url,
+                    f"[{color}]{result.status_code}[/{color}]",
+                    f"{result.elapsed_time * 1000:.0f}ms",
+                    f"{result.total_size} bytes",
+                )
+            else:
+                table.add_row(url, f"[bold red]✗[/bold red] [red]{result}[/red]", "-", "-")
+        
+        console.print(Group(Text(), table, Text()))
     
     @staticmethod
-    def _format_body(response: HttpResponse) -> None:
+    def _format_body(response: HttpResponse) -> list[RenderableType]:
         """Formatea el body según el content-type"""
+        from rich.syntax import Syntax
+        
         content_type = response.headers.get("content-type", "")
         
         # JSON
         if "application/json" in content_type:
             try:
-                parsed = json.loads(response.body)
-                formatted = json.dumps(parsed, indent=2, ensure_ascii=False)
-                syntax = Syntax(formatted, "json", theme="monokai", line_numbers=False)
-                console.print(syntax)
-            except json.JSONDecodeError:
-                console.print(response.body)
+                formatted = _json.dumps_indented(_json.loads(response.body))
+                if len(formatted) > _HIGHLIGHT_LIMIT:
+                    # Pygments es lento en bodies grandes: mostrar un preview en texto plano
+                    return [
+                        *_plain_body(formatted, response.total_size),
+                        Text("(syntax highlighting disabled for large body)", style="dim"),
+                    ]
+                return [Syntax(formatted, _get_lexer("json"), theme="monokai", line_numbers=False)]
+            except _json.JSONDecodeError:
+                return _plain_body(response.body, response.total_size)
         
         # HTML
         elif "text/html" in content_type:
             # Mostrar solo primeras líneas de HTML
-            lines = response.body.split("\n")[:10]
+            lines = response.body.split("\n", 10)[:10]
             preview = "\n".join(lines)
             if len(lines) >= 10:
                 preview += "\n..."
-            syntax = Syntax(preview, "html", theme="monokai", line_numbers=False)
-            console.print(syntax)
-            console.print(f"[dim](HTML response truncated, {len(response.body)} bytes total)[/dim]")
+            return [
+                Syntax(preview, _get_lexer("html"), theme="monokai", line_numbers=False),
+                Text(f"(HTML response truncated, {response.total_size} bytes total)", style="dim"),
+            ]
         
         # XML
         elif "application/xml" in content_type or "text/xml" in content_type:
-            syntax = Syntax(response.body[:500], "xml", theme="monokai", line_numbers=False)
-            console.print(syntax)
-            if len(response.body) > 500:
-                console.print(f"[dim](XML truncated, {len(response.body)} bytes total)[/dim]")
+            parts: list[RenderableType] = [
+                Syntax(response.body[:500], _get_lexer("xml"), theme="monokai", line_numbers=False)
+            ]
+            if len(response.body) > 500 or response.truncated:
+                parts.append(Text(f"(XML truncated, {response.total_size} bytes total)", style="dim"))
+            return parts
         
         # Plain text
         else:
             # Limitar output de texto plano
-            if len(response.body) > 1000:
-                console.print(response.body[:1000])
-                console.print(f"[dim]... ({len(response.body)} bytes total)[/dim]")
-            else:
-                console.print(response.body)
-    
-    @staticmethod
-    def _get_status_color(status_code: int) -> str:
-        """Retorna color según status code"""
-        if 200 <= status_code < 300:
-            return "green"
-        elif 300 <= status_code < 400:
-            return "yellow"
-        elif 400 <= status_code < 500:
-            return "orange1"
-        elif 500 <= status_code < 600:
-            return "red"
-        else:
-            return "white"
-    
-    @staticmethod
-    def _get_status_text(status_code: int) -> str:
-        """Retorna texto descriptivo del status code"""
-        status_texts = {
-            200: "OK",
-            201: "Created",
-            204: "No Content",
-            301: "Moved Permanently",
-            302: "Found",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            405: "Method Not Allowed",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable",
-        }
-        return status_texts.get(status_code, "")
+            if len(response.body) > 1000 or response.truncated:
+                return [
+                    Text(response.body[:1000]),
+                    Text(f"... ({response.total_size} bytes total)", style="dim"),
+                ]
+            return [Text(response.body)]
 
 
 def print_error(message: str) -> None:
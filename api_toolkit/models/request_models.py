@@ -1,12 +1,19 @@
 """
 Modelos de datos para requests HTTP
 """
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+# Máximo de bytes del body que se guardan por defecto (1 MiB)
+DEFAULT_MAX_BODY = 1024 * 1024
 
-@dataclass
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"})
+
+
+@dataclass(slots=True)
 class HttpRequest:
     """Representa un request HTTP"""
     method: str
@@ -17,21 +24,23 @@ class HttpRequest:
     
     def __post_init__(self) -> None:
         """Validaciones después de inicialización"""
-        self.method = self.method.upper()
-        valid_methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-        if self.method not in valid_methods:
+        self.method = sys.intern(self.method.upper())
+        if self.method not in _VALID_METHODS:
             raise ValueError(f"Método inválido: {self.method}")
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpResponse:
     """Representa una respuesta HTTP"""
     status_code: int
-    headers: dict[str, str]
+    headers: Mapping[str, str]  # httpx.Headers: acceso case-insensitive
     body: str
     elapsed_time: float  # en segundos
     request: HttpRequest
     timestamp: datetime = field(default_factory=datetime.now)
+    from_cache: bool = False
+    truncated: bool = False  # el body se cortó en max_body bytes
+    total_size: int = 0  # tamaño real del body en bytes
     
     @property
     def is_success(self) -> bool:
@@ -49,7 +58,7 @@ class HttpResponse:
         return 500 <= self.status_code < 600
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestHistory:
     """Representa un registro en el histórico de requests"""
     id: int
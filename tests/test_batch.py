@@ -0,0 +1,110 @@
+"""
+Tests del modo batch: HttpClient.gather y el comando `request batch`
+"""
+import asyncio
+from pathlib import Path
+
+import httpx
+import respx
+from click.testing import CliRunner
+
+from api_toolkit.commands.request import request_group
+from api_toolkit.core.http_client import HttpClient
+from api_toolkit.models.request_models import HttpResponse
+
+BASE_URL = "https://api.example.com"
+
+
+class TestGather:
+    """Tests de HttpClient.gather"""
+
+    @respx.mock
+    async def test_preserves_order(self) -> None:
+        async def reply(request: httpx.Request) -> httpx.Response:
+            # Los primeros requests terminan últimos
+            await asyncio.sleep(0.01 * (5 - int(request.url.path.strip("/"))))
+            return httpx.Response(200, text=request.url.path)
+
+        respx.get(url__startswith=BASE_URL).mock(side_effect=reply)
+        urls = [f"{BASE_URL}/{i}" for i in range(5)]
+
+        async with HttpClient() as client:
+            results = await client.gather(urls)
+
+        assert [r.body for r in results if isinstance(r, HttpResponse)] == [
+            f"/{i}" for i in range(5)
+        ]
+
+    @respx.mock
+    async def test_returns_exceptions_per_url(self) -> None:
+        respx.get(f"{BASE_URL}/ok").mock(return_value=httpx.Response(200, text="ok"))
+        respx.get(f"{BASE_URL}/down").mock(side_effect=httpx.ConnectError("boom"))
+
+        async with HttpClient() as client:
+            ok, down = await client.gather([f"{BASE_URL}/ok", f"{BASE_URL}/down"])
+
+        assert isinstance(ok, HttpResponse)
+        assert ok.body == "ok"
+        assert isinstance(down, httpx.HTTPError)
+        assert "No se pudo conectar" in str(down)
+
+    @respx.mock
+    async def test_respects_concurrency_bound(self) -> None:
+        active = 0
+        peak = 0
+
+        async def reply(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        respx.get(url__startswith=BASE_URL).mock(side_effect=reply)
+        urls = [f"{BASE_URL}/{i}" for i in range(12)]
+
+        async with HttpClient() as client:
+            results = await client.gather(urls, concurrency=3)
+
+        assert len(results) == 12
+        assert peak == 3
+
+    @respx.mock
+    async def test_does_not_open_sync_client(self) -> None:
+        respx.get(BASE_URL).mock(return_value=httpx.Response(200))
+
+        async with HttpClient() as client:
+            await client.gather([BASE_URL])
+            assert client._client is None
+
+
+class TestBatchCommand:
+    """Tests del comando `request batch`"""
+
+    def test_rejects_invalid_method(self) -> None:
+        result = CliRunner().invoke(request_group, ["batch", "-X", "FOO", BASE_URL])
+
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
+
+    @respx.mock
+    def test_method_is_case_insensitive(self) -> None:
+        route = respx.post(BASE_URL).mock(return_value=httpx.Response(201))
+
+        result = CliRunner().invoke(request_group, ["batch", "-X", "post", BASE_URL])
+
+        assert result.exit_code == 0
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_reads_urls_from_file(self, tmp_path: Path) -> None:
+        route = respx.get(url__startswith=BASE_URL).mock(return_value=httpx.Response(200))
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text(f"# comentario\n{BASE_URL}/a\n\n{BASE_URL}/b\n")
+
+        result = CliRunner().invoke(request_group, ["batch", "-f", str(url_file)])
+
+        assert result.exit_code == 0
+        assert route.call_count == 2
+        assert "2 requests completados" in result.output
@@ -0,0 +1,226 @@
+"""
+Tests de la caché de responses y de su uso en HttpClient
+"""
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from api_toolkit.core.cache import ResponseCache
+from api_toolkit.core.http_client import HttpClient
+
+URL = "https://api.example.com/users"
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    """Ruta de una base de datos de caché temporal"""
+    return tmp_path / "responses.db"
+
+
+def _client(cache_path: Path, ttl: int = 300, max_body: int = 1024 * 1024) -> HttpClient:
+    """Crea un HttpClient con una caché nueva sobre cache_path"""
+    return HttpClient(cache=ResponseCache(path=cache_path, ttl=ttl), max_body=max_body)
+
+
+class TestResponseCache:
+    """Tests de ResponseCache"""
+
+    def test_get_miss(self, cache_path: Path) -> None:
+        cache = ResponseCache(path=cache_path)
+        assert cache.get("missing") is None
+        assert cache.lookup("missing") is None
+
+    def test_set_and_get(self, cache_path: Path) -> None:
+        cache = ResponseCache(path=cache_path)
+        cache.set("key", {"body": "hola"})
+        assert cache.get("key") == {"body": "hola"}
+        assert cache.lookup("key") == ({"body": "hola"}, True)
+
+    def test_expired_entry(self, cache_path: Path) -> None:
+        cache = ResponseCache(path=cache_path)
+        cache.set("key", {"body": "hola"}, ttl=0)
+        assert cache.get("key") is None
+        assert cache.lookup("key") == ({"body": "hola"}, False)
+
+    def test_persists_between_instances(self, cache_path: Path) -> None:
+        ResponseCache(path=cache_path).set("key", {"body": "hola"})
+        assert ResponseCache(path=cache_path).get("key") == {"body": "hola"}
+
+    def test_make_key_ignores_header_order(self) -> None:
+        key_a = ResponseCache.make_key("GET", URL, {"A": "1", "B": "2"})
+        key_b = ResponseCache.make_key("GET", URL, {"B": "2", "A": "1"})
+        assert key_a == key_b
+        assert key_a != ResponseCache.make_key("GET", URL, {"A": "1"})
+
+
+class TestHttpClientCache:
+    """Tests del uso de la caché desde HttpClient"""
+
+    @respx.mock
+    def test_miss_then_hit(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(return_value=httpx.Response(200, text="hola"))
+
+        with _client(cache_path) as client:
+            first = client.get(URL)
+        with _client(cache_path) as client:
+            second = client.get(URL)
+
+        assert route.call_count == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.body == "hola"
+        assert second.total_size == 4
+
+    @respx.mock
+    def test_post_is_not_cached(self, cache_path: Path) -> None:
+        route = respx.post(URL).mock(return_value=httpx.Response(200, text="ok"))
+
+        with _client(cache_path) as client:
+            client.post(URL, body="x")
+            response = client.post(URL, body="x")
+
+        assert route.call_count == 2
+        assert not response.from_cache
+
+    @respx.mock
+    def test_expired_without_validators_is_a_miss(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(return_value=httpx.Response(200, text="hola"))
+
+        with _client(cache_path, ttl=0) as client:
+            client.get(URL)
+            response = client.get(URL)
+
+        assert route.call_count == 2
+        assert "if-none-match" not in route.calls.last.request.headers
+        assert not response.from_cache
+
+    @respx.mock
+    def test_no_store_is_not_cached(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(return_value=httpx.Response(
+            200, text="secreto", headers={"Cache-Control": "no-store"}
+        ))
+
+        with _client(cache_path) as client:
+            client.get(URL)
+            response = client.get(URL)
+
+        assert route.call_count == 2
+        assert not response.from_cache
+
+    @respx.mock
+    def test_truncated_body_is_not_cached(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(return_value=httpx.Response(200, text="x" * 100))
+
+        with _client(cache_path, max_body=10) as client:
+            first = client.get(URL)
+            second = client.get(URL)
+
+        assert first.truncated
+        assert route.call_count == 2
+        assert not second.from_cache
+
+    @respx.mock
+    def test_hit_respects_max_body(self, cache_path: Path) -> None:
+        respx.get(URL).mock(return_value=httpx.Response(200, text="x" * 100))
+
+        with _client(cache_path) as client:
+            client.get(URL)
+        with _client(cache_path, max_body=10) as client:
+            response = client.get(URL)
+
+        assert response.from_cache
+        assert response.body == "x" * 10
+        assert response.truncated
+        assert response.total_size == 100
+
+    @respx.mock
+    def test_hit_respects_body_encoding(self, cache_path: Path) -> None:
+        respx.get(URL).mock(return_value=httpx.Response(
+            200,
+            content="ñandú ñoño".encode("latin-1"),
+            headers={"Content-Type": "text/plain; charset=latin-1"},
+        ))
+
+        with _client(cache_path) as client:
+            client.get(URL)
+        with _client(cache_path, max_body=10) as client:
+            exact = client.get(URL)
+        with _client(cache_path, max_body=5) as client:
+            cut = client.get(URL)
+
+        assert exact.body == "ñandú ñoño"
+        assert not exact.truncated
+        assert cut.body == "ñandú"
+        assert cut.truncated
+
+    @respx.mock
+    def test_etag_revalidation(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(side_effect=[
+            httpx.Response(200, text="hola", headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"', "X-Extra": "nuevo"}),
+        ])
+
+        with _client(cache_path, ttl=0) as client:
+            client.get(URL)
+        with _client(cache_path) as client:
+            revalidated = client.get(URL)
+            fresh = client.get(URL)
+
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["if-none-match"] == '"v1"'
+        assert revalidated.from_cache
+        assert revalidated.status_code == 200
+        assert revalidated.body == "hola"
+        assert revalidated.headers["x-extra"] == "nuevo"
+        # El 304 renueva el TTL: el siguiente request no sale a la red
+        assert fresh.from_cache
+
+    @respx.mock
+    def test_last_modified_revalidation(self, cache_path: Path) -> None:
+        last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        route = respx.get(URL).mock(side_effect=[
+            httpx.Response(200, text="hola", headers={"Last-Modified": last_modified}),
+            httpx.Response(304),
+        ])
+
+        with _client(cache_path, ttl=0) as client:
+            client.get(URL)
+            response = client.get(URL)
+
+        assert route.calls.last.request.headers["if-modified-since"] == last_modified
+        assert response.from_cache
+        assert response.body == "hola"
+
+    @respx.mock
+    def test_no_cache_always_revalidates(self, cache_path: Path) -> None:
+        headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+        route = respx.get(URL).mock(side_effect=[
+            httpx.Response(200, text="hola", headers=headers),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ])
+
+        with _client(cache_path) as client:
+            responses = [client.get(URL) for _ in range(4)]
+
+        assert route.call_count == 4
+        assert all(call.request.headers["if-none-match"] == '"v1"' for call in route.calls[1:])
+        assert all(response.from_cache for response in responses[1:])
+
+    @respx.mock
+    def test_no_cache_without_validators_is_not_served(self, cache_path: Path) -> None:
+        route = respx.get(URL).mock(side_effect=[
+            httpx.Response(200, text="v1", headers={"Cache-Control": "no-cache"}),
+            httpx.Response(200, text="v2"),
+        ])
+
+        with _client(cache_path) as client:
+            client.get(URL)
+            response = client.get(URL)
+
+        assert route.call_count == 2
+        assert not response.from_cache
+        assert response.body == "v2"
@@ -0,0 +1,49 @@
+"""
+Tests de los helpers JSON de api_toolkit.core._json
+"""
+import pytest
+
+from api_toolkit.core import _json
+
+
+class TestLoads:
+    """Tests de _json.loads"""
+
+    def test_parses_document(self) -> None:
+        assert _json.loads('{"a": [1, 2.5, "ñ", null]}') == {"a": [1, 2.5, "ñ", None]}
+
+    @pytest.mark.parametrize("value", [
+        18446744073709551615,  # u64 máximo
+        18446744073709551616,  # u64 máximo + 1
+        -9223372036854775808,  # i64 mínimo
+        -9223372036854775809,  # i64 mínimo - 1
+        -9999999999999999999,
+        123456789012345678901234567890,
+    ])
+    def test_large_integers_stay_exact(self, value: int) -> None:
+        result = _json.loads(f'{{"a": {value}}}')
+        assert result["a"] == value
+        assert isinstance(result["a"], int)
+
+    def test_accepts_nan_and_infinity(self) -> None:
+        result = _json.loads("[NaN, Infinity, -Infinity]")
+        assert result[0] != result[0]
+        assert result[1:] == [float("inf"), float("-inf")]
+
+    def test_invalid_json_raises(self) -> None:
+        with pytest.raises(_json.JSONDecodeError):
+            _json.loads("{bad")
+
+
+class TestDumpsIndented:
+    """Tests de _json.dumps_indented"""
+
+    def test_indents_with_two_spaces(self) -> None:
+        assert _json.dumps_indented({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_keeps_non_ascii(self) -> None:
+        assert _json.dumps_indented(["ñ"]) == '[\n  "ñ"\n]'
+
+    def test_deep_nesting(self) -> None:
+        nested = _json.loads("[" * 300 + "]" * 300)
+        assert _json.dumps_indented(nested).count("[") == 300